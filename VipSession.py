@@ -1,11 +1,25 @@
 from __future__ import annotations
 import os
+import io
 import json
+import random
+import re
+import shutil
 import tarfile
+import tempfile
+import threading
 import time
-from pathlib import Path, WindowsPath, PurePosixPath
+import zlib
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path, PurePosixPath
 from warnings import warn
 
+from requests.exceptions import RequestException
+from urllib3.exceptions import HTTPError
+
 import vip
 
 """
@@ -54,6 +68,8 @@ class VipSession():
 
     # Default prefix for unnamed sessions
     _NAME_PREFIX = "session_"
+    # Allowed session names
+    _SESSION_NAME_RE = re.compile(r"[\w\- ]*")
     # Default path to save session outputs on the current machine
     _LOCAL_PATH = os.path.join(".", "vip_outputs")
     # Default path to upload and download data on VIP servers
@@ -62,6 +78,38 @@ class VipSession():
     _SAVE_FILE = "session_data.json"
     # List of pipelines available to the user
     _PIPELINES = []
+    # Same pipelines, for exact-match lookups
+    _PIPELINES_SET = frozenset()
+    # Time of the last update of `_PIPELINES` (`time.monotonic()`) and lifetime in seconds
+    _PIPELINES_TIME = 0
+    _PIPELINES_TTL = 300
+    # Pipeline definitions already loaded in this process
+    _PIPELINE_DEFS = {}
+    # Parameter names and types for each pipeline in `_PIPELINE_DEFS`
+    _PIPELINE_META = {}
+    # Default path to cache pipeline definitions on the current machine
+    _CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vip-python-client", "pipeline_defs")
+    # Lifetime of a cached pipeline definition (seconds)
+    _CACHE_TTL = 7*24*3600
+    # Functions to check directory existence, depending on data location
+        # (looked up at each call, so that the functions can be replaced in the modules)
+    _IS_DIR = {
+        "local": lambda path: os.path.isdir(path), 
+        "vip": lambda path: vip.is_dir(path),
+    }
+    # Number of calls to `init()` (input settings checked with a previous API key are checked again)
+    _INIT_COUNT = 0
+    # Information kept for each output file of an execution
+    _OUTPUT_KEYS = ("path", "isDirectory", "size", "mimeType")
+    # Maximum number of parallel requests to VIP servers (size of the connection pool)
+    _MAX_THREADS = vip.MAX_CONNECTIONS
+    # Buffer size for reading and extracting tarballs (2 MiB instead of 16 KiB)
+    _TAR_BUFSIZE = 2 << 20
+    # Errors raised when a transfer from VIP is interrupted (the file can be downloaded again)
+    _TRANSFER_ERRORS = (RequestException, HTTPError)
+    # Replacement of forbidden characters in Windows paths (if current OS is Windows)
+    _IS_WINDOWS = (os.name == "nt")
+    _WINDOWS_CHARS = str.maketrans(dict.fromkeys('<>:"?* ', '-'))
 
                     #############
     ################ Constructor ##################
@@ -101,7 +149,7 @@ class VipSession():
         self._session_name = (
             session_name if session_name
             # default value
-            else self._NAME_PREFIX + time.strftime("%y%m%d_%H%M%S", time.localtime())
+            else self._NAME_PREFIX + datetime.now().strftime("%y%m%d_%H%M%S")
         )
         self._check_session_name()
         # Assign: Local path to the output data
@@ -114,6 +162,17 @@ class VipSession():
         if verbose:
             print(f"\n<<< SESSION '{self._session_name}' >>>\n")
         # SESSION DATA
+        # Empty values for all other properties (a session file may not define them all)
+        self._pipeline_id = ""
+        self._local_input_dir = ""
+        self._vip_input_dir = ""
+        self._vip_output_dir = ""
+        self._input_settings = {}
+        self._workflows = {}
+        self._workflow_status = {}
+        self._status_counts = Counter()
+        self._checked_settings = set()
+        self._last_save = None # (session file, content) of the last save
         # Check existence of data from a previous session
         session_file = os.path.join(self._local_output_dir, self._SAVE_FILE)
         if os.path.isfile(session_file):
@@ -151,7 +210,7 @@ class VipSession():
                     print("Checked." if done else "Unchecked.")
             self._input_settings = self._vip_input_settings(input_settings) # set VIP values
             # Workflow inventory (default value)
-            self._workflows = {}
+            self._set(workflows={})
             # End
             if verbose: 
                 print("---------------")
@@ -167,11 +226,12 @@ class VipSession():
 
     # ($A.1) Login to VIP
     @classmethod
-    def init(cls, api_key: str, verbose=True, **kwargs) -> VipSession:
+    def init(cls, api_key: str, verbose=True, force_refresh=False, **kwargs) -> VipSession | None:
         """
         Handshakes with VIP using your API key. 
         Prints a list of pipelines available with the API key, unless `verbose` is False.
-        Returns a VipSession instance which properties can be provided as keyword arguments (`kwargs`).
+        If session properties are provided as keyword arguments (`kwargs`), 
+        returns a VipSession instance with these properties. Returns None otherwise.
 
         Input `api_key` can be either:
         A. (unsafe) a string litteral containing your API key, or
@@ -179,9 +239,13 @@ class VipSession():
         C. (safer) the name of some environment variable containing your API key.
 
         In cases B or C, the API key will be loaded from the local file or the environment variable.        
+
+        The list of available pipelines is only loaded from VIP when it is displayed (`verbose`)
+        or when `force_refresh` is True. Otherwise it is loaded at first need.
         """
         # Check if `api_key` is in a local file or environment variable
-        if os.path.exists(api_key): # local file
+            # (long strings and multi-line strings cannot be file paths)
+        if len(api_key) < 260 and "\n" not in api_key and os.path.isfile(api_key): # local file
             with open(api_key, "r") as kfile:
                 true_key = kfile.read().strip()
         elif api_key in os.environ: # environment variable
@@ -201,32 +265,39 @@ class VipSession():
             # setApiKey() may throw JSONDecodeError in special cases
             print(f"(!) Unable to set the VIP API key: {true_key}.\n    Original error message:")
             raise json_error
-        # Update the list of available pipelines
-        try:
-            cls._get_available_pipelines()
-            # RunTimeError is handled downstream
-        except(json.decoder.JSONDecodeError) as json_error:
-            # The user still cannot communicate with VIP
-            print(f"(!) Unable to communicate with VIP. Check the API key:\n\t{true_key}")
-            print(f"    Original error messsage:")
-            raise json_error
-        # Double check user can access pipelines
-        assert cls._PIPELINES, f"Your API key does not allow you to execute pipelines on VIP. \n\tAPI key: {true_key}"
+        # The list of pipelines and the checked input settings may belong to another API key
+        cls._PIPELINES = []
+        cls._PIPELINES_SET = frozenset()
+        cls._INIT_COUNT += 1
+        # Update the list of available pipelines (only if needed now)
+        if verbose or force_refresh:
+            try:
+                cls._pipelines()
+                # RunTimeError is handled downstream
+            except(json.decoder.JSONDecodeError) as json_error:
+                # The user still cannot communicate with VIP
+                print(f"(!) Unable to communicate with VIP. Check the API key:\n\t{true_key}")
+                print(f"    Original error messsage:")
+                raise json_error
+            # Double check user can access pipelines
+            assert cls._PIPELINES, f"Your API key does not allow you to execute pipelines on VIP. \n\tAPI key: {true_key}"
         if verbose:
             print("\nYou are communicating with VIP.\nAvailable pipelines:")
             print(*cls._PIPELINES, sep=", ")
-        # Return a VipSession instance for method cascading
-        return VipSession(verbose=True if kwargs else False, **kwargs)
+        # Return a VipSession instance for method cascading (only if requested)
+        return VipSession(verbose=True, **kwargs) if kwargs else None
     # ------------------------------------------------
    
     # ($A.2) Upload a dataset on VIP servers
-    def upload_inputs(self, input_dir="", update_files=True, verbose=True) -> VipSession:
+    def upload_inputs(self, input_dir="", update_files=True, verbose=True, max_workers=8) -> VipSession:
         """
         Uploads to VIP servers a dataset contained in the local directory `input_dir` (if needed).
         - If `input_dir` is not provided, session properties are used. If provided, session properties are updated.
-        - If `update_files` is True, the input directory on VIP will be checked in depth to upload missing files.
+        - If `update_files` is True, the input directory on VIP will be checked in depth to upload missing files
+        (and files with a different size).
         If `update_files` is False and some input directory already exists on VIP, the upload procedure is skipped to save time.
         - Set `verbose` to False to upload silently.
+        - `max_workers` (int) Maximum number of files uploaded simultaneously (16 at most).
 
         Session data are saved the end of the upload procedure.
 
@@ -263,7 +334,7 @@ class VipSession():
             print("-----------------------------")
         # Upload the input repository
         try:
-            failures = self._upload_dir(input_dir, self._vip_input_dir, verbose)
+            failures = self._upload_dir(input_dir, self._vip_input_dir, verbose, max_workers)
             # Display report
             if verbose:
                 print("-----------------------------")
@@ -288,7 +359,7 @@ class VipSession():
 
     # ($A.3) Launch executions on VIP 
     def launch_pipeline(
-            self, pipeline_id="", input_settings:dict={}, nb_runs=1, verbose=True
+            self, pipeline_id="", input_settings:dict={}, nb_runs=1, verbose=True, parallel=True
         ) -> VipSession:
         """
         Launches pipeline executions on VIP.
@@ -299,6 +370,8 @@ class VipSession():
         - `input_settings` (dict) All parameters needed to run the pipeline.
         - `nb_runs` (int) Number of parallel runs of the same pipeline with the same settings.
         - Set `verbose`to False to launch silently.
+        - If `parallel` is True, the `nb_runs` executions are submitted to VIP simultaneously.
+        Set it to False to submit them one after another.
         
         Default behaviour:
         - Raises AssertionError in case of wrong inputs 
@@ -329,11 +402,13 @@ class VipSession():
         # Update the input parameters
         if not input_settings:
             assert self._input_settings, f"Please provide input parameters for the pipeline: {self._pipeline_id}."
-        else:
+        elif input_settings is not self._input_settings:
+            # Convert local paths only once (this resolves every input path)
+            vip_settings = self._vip_input_settings(input_settings)
             # check conflicts with instance value
-            assert not self._input_settings or (self._vip_input_settings(input_settings) == self._input_settings), \
+            assert not self._input_settings or (vip_settings == self._input_settings), \
                 f"Input settings are already set for this session."
-            self._set(input_settings=input_settings)
+            self._input_settings = vip_settings
         # Check the input parameters (this may take some time)
         if verbose: print("Checking the input parameters ... ", end="")
         try:
@@ -351,21 +426,43 @@ class VipSession():
             print("\tSession Name:", self._session_name)
             print("\tPipeline Identifier:", self._pipeline_id)
             print("\tStarted workflows:", end="\n\t\t")
+        # Lock on the workflow inventory (updated from several threads)
+        lock = threading.Lock()
+        # Function to launch 1 execution and record its information
+        def launch_one() -> None:
+            workflow_id = vip.init_exec(self._pipeline_id, self._session_name, self._input_settings)
+            # Record the workflow as soon as it is started (its information may fail to load)
+            with lock:
+                if verbose: print(workflow_id, end=", ")
+                self._set_workflow(workflow_id, {"status": "Unknown", "start": "", "outputs": []})
+            # Update the workflow inventory
+            infos = self._get_exec_infos(workflow_id)
+            with lock:
+                self._set_workflow(workflow_id, infos)
         # Launch all executions in parallel
+        nb_before = len(self._workflows)
         try:
-            for nEx in range(nb_runs):
-                # Initiate Execution
-                workflow_id = vip.init_exec(self._pipeline_id, self._session_name, self._input_settings)
-                # Display
-                if verbose: print(workflow_id, end=", ")
-                # Update the workflow inventory
-                self._workflows[workflow_id] = self._get_exec_infos(workflow_id)
-                # Display success
-                if verbose: 
-                    print("\n-------------------------------------")
-                    print("Done.")
+            if parallel and nb_runs > 1:
+                with ThreadPoolExecutor(max_workers=min(nb_runs, self._MAX_THREADS)) as executor:
+                    futures = [executor.submit(launch_one) for _ in range(nb_runs)]
+                    # Wait for every execution to be recorded before raising any error
+                    first_error = None
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                        except Exception as error:
+                            first_error = first_error or error
+                    if first_error:
+                        raise first_error
+            else:
+                for _ in range(nb_runs):
+                    launch_one()
+            # Display success
+            if verbose: 
+                print("\n-------------------------------------")
+                print("Done.")
         except RuntimeError as vip_error:
-            print("\n(!) Stopped after {nEx} execution(s).")
+            print(f"\n(!) Stopped after {len(self._workflows) - nb_before} execution(s).")
             self._handle_vip_error(vip_error)
         finally:
             # In any case, save session properties
@@ -378,7 +475,8 @@ class VipSession():
     def monitor_workflows(self, waiting_time=30, verbose=True) -> VipSession:
         """
         Updates and displays status for each execution launched in the current session.
-        - If an execution is still runnig, updates status every `waiting_time` (seconds) until all runs are done.
+        - If an execution is still runnig, updates status until all runs are done.
+        Updates are frequent at first, then slow down to once every `waiting_time` (seconds).
         - If `verbose`is True, displays a full report when all executions are done.
         """
         if verbose: print("\n<<< MONITOR WORKFLOW >>>\n")
@@ -398,14 +496,20 @@ class VipSession():
             self._execution_report(verbose)
             # Display standby
             if verbose:
-                print("\n-------------------------------------------------------------")
-                print("The current proccess will wait until all executions are over.")
-                print("Their progress can be monitored on VIP website:")
-                print("\thttps://vip.creatis.insa-lyon.fr/")
-                print("-------------------------------------------------------------")
+                ruler = "-" * 61
+                print(
+                    "", ruler,
+                    "The current proccess will wait until all executions are over.",
+                    "Their progress can be monitored on VIP website:",
+                    "\thttps://vip.creatis.insa-lyon.fr/",
+                    ruler, sep="\n"
+                )
             # Standby until all executions are over
+                # (refresh often at first, then every `waiting_time` seconds)
+            interval = min(2, waiting_time)
             while self._still_running():
-                time.sleep(waiting_time)
+                time.sleep(interval)
+                interval = min(waiting_time, interval * 1.5)
                 save_path = self._update_workflows(save_session=True)
             # Display the end of executions
             if verbose: print("All executions are over.")
@@ -418,11 +522,12 @@ class VipSession():
     # ------------------------------------------------
 
     # ($A.5) Download execution outputs from VIP servers 
-    def download_outputs(self, unzip=True, verbose=True) -> VipSession:
+    def download_outputs(self, unzip=True, verbose=True, max_workers=8) -> VipSession:
         """
         Downloads all session outputs from VIP servers.
         - If `unzip` is True, extracts the data if any output is an GZIP archive.
         - Set `verbose` to False to download silently.
+        - `max_workers` (int) Maximum number of files downloaded simultaneously (16 at most).
         """
         if verbose: print("\n<<< DOWNLOAD OUTPUTS >>>\n")
         # Check if current session has existing workflows
@@ -447,6 +552,16 @@ class VipSession():
         nb_exec += len(report['Finished']) if "Finished" in report else 0
         nb_exec += len(report['Removed']) if "Removed" in report else 0
         nExec=0
+        # Inventory of the local outputs (one directory scan instead of one check per file)
+            # (The scan starts from the same root as `_get_local_output_path()`, translated on Windows)
+        local_root = str(self._output_dirs[1])
+        if self._IS_WINDOWS: 
+            local_root = local_root.translate(self._WINDOWS_CHARS)
+        existing = {
+            os.path.join(root, name) 
+            for root, dirs, files in os.walk(local_root)
+            for name in dirs + files
+        }
         # Browse workflows with removed data and check if files are missing
         if "Removed" in report :
             for wid in report["Removed"]:
@@ -468,7 +583,7 @@ class VipSession():
                     # Get the local equivalent path
                     local_file = self._get_local_output_path(vip_file)
                     # Check file existence on the local machine
-                    if not os.path.exists(local_file): 
+                    if local_file not in existing: 
                         missing_file = True
                 # After checking all files, update the display
                 if verbose: 
@@ -491,11 +606,9 @@ class VipSession():
                     wid, ", started on:", self._workflows[wid]["start"])
             # Get the path of the returned files on VIP
             vip_outputs = self._workflows[wid]["outputs"]
-            # Browse the output files
-            nFile = 0 # File count
-            missing_file = False # True if local files are missing
-            for output in vip_outputs:
-                nFile+=1
+            # Browse the output files and look for missing ones
+            to_download = [] # (file count, output, local path)
+            for nFile, output in enumerate(vip_outputs, start=1):
                 # Get the output path on VIP
                 vip_file = output["path"]
                 # TODO: implement the case in which the output is a directory (mirror _upload_dir ?)
@@ -504,33 +617,50 @@ class VipSession():
                 # Get the local equivalent path
                 local_file = self._get_local_output_path(vip_file)
                 # Check file existence on the local machine
-                if os.path.exists(local_file): 
+                if local_file in existing: 
                     continue
-                # If not, update the output data
-                missing_file = True
-                # Make the parent directory (if needed)
+                # If not, make the parent directory (if needed)
                 local_dir = os.path.dirname(local_file)
                 if self._make_dir(local_dir) and verbose: print("\tCreated:", local_dir)
-                # Display the process
-                size = f"{output['size']/(1<<20):,.1f}MB"
-                if verbose: print(f"\t[{nFile}/{len(vip_outputs)}] Downloading file ({size}):", \
-                                    os.path.basename(local_file), end=" ... ")
-                # Download the file from VIP servers
-                if self._download_file( vip_path=vip_file, local_path=local_file):
-                    # Display success
-                    if verbose: print("Done.")
-                    # If the output is a GZIP archive, extract the files and delete the archive
-                    if unzip and output["mimeType"]=="application/gzip":
-                        if verbose: print("\t\tExtracting archive content ...", end=" ")
-                        if self._extract_archive(local_file):
-                            if verbose: print("Done.") # Display success
-                        elif verbose: 
-                            print("Error.") # Display failure
-                else: # failure while downloading the output file
-                    # Update display
-                    if verbose: print(f"\n(!)\tSomething went wrong in the process.")
-                    # Update missing files
-                    failures.append(local_file)
+                # Update the output data
+                to_download.append((nFile, output, local_file))
+            missing_file = bool(to_download) # True if local files are missing
+            # Download the missing files in parallel (displayed by order of completion)
+            if to_download:
+                with ThreadPoolExecutor(max_workers=min(max_workers, self._MAX_THREADS, len(to_download))) as executor:
+                    futures = {
+                        executor.submit(
+                            self._download_output, 
+                            vip_path=output["path"], 
+                            local_path=local_file,
+                            extract=(unzip and output["mimeType"]=="application/gzip")
+                        ): (nFile, output, local_file)
+                        for nFile, output, local_file in to_download
+                    }
+                    for future in as_completed(futures):
+                        nFile, output, local_file = futures[future]
+                        done, extracted = future.result()
+                        if done:
+                            # Update the inventory
+                            existing.add(local_file)
+                        else: # failure while downloading the output file
+                            # Update missing files
+                            failures.append(local_file)
+                        # Display the process (written at once for each file)
+                        if verbose:
+                            size = output.get("size")
+                            size = f"{size/(1<<20):,.1f}MB" if isinstance(size, (int, float)) else "size unknown"
+                            display = f"\t[{nFile}/{len(vip_outputs)}] Downloading file ({size}): " \
+                                    + os.path.basename(local_file) + " ... "
+                            if not done:
+                                display += "\n(!)\tSomething went wrong in the process."
+                            else:
+                                # Display success
+                                display += "Done."
+                                # Display the extraction of GZIP archives
+                                if extracted is not None:
+                                    display += "\n\t\tExtracting archive content ... " + ("Done." if extracted else "Error.")
+                            print(display)
             # End of file loop
             if verbose:
                 if not missing_file: # All files were already there
@@ -591,34 +721,6 @@ class VipSession():
 
         Displays warning in case of failure. 
         """
-        # Function to delete a path on VIP with warning
-        def delete_path(path, verbose) -> bool:
-            """
-            Deletes `path` on VIP servers and waits until `path` is removed.
-            Raises a warning in case of failure or in case of success
-            """
-            done = vip.delete_path(path)
-            if not done: # Errors are handled by returning False in `vip.delete_path()`
-                msg = f"\n(!) '{path}' could not be removed from VIP servers.\n"
-                msg += "Check your connection with VIP and path existence on VIP website.\n"
-                if verbose: print(msg)
-            else:
-                # Standby until path is indeed removed (give up after some time)
-                start = time.time()
-                t_lim = 300 # max time in seconds
-                t = time.time() - start
-                while (t < t_lim) and vip.exists(path):
-                    time.sleep(2)
-                    t = time.time() - start
-                # Check if the data have indeed been removed
-                if t >= t_lim:
-                    # Display warning
-                    msg = f"\n(!) '{path}' was queued for deletion, but still not removed after {t_lim} seconds.\n"
-                    msg += "Run finish() again later to end the process.\n"
-                    if verbose: print(msg)
-                    done = False
-            # Return success flag
-            return done 
         # Initial display
         if verbose: print("\n<<< FINISH >>>\n")
         # Check if workflows are still running (without call to VIP)
@@ -651,7 +753,7 @@ class VipSession():
             done = True
         else:
             # Erase the session folder on VIP
-            done = delete_path(path, verbose)
+            done = self._delete_and_check(path, verbose=verbose)
             # Display success
             if verbose and done: print("Done.\n")
         # End the procedure in case of failure
@@ -660,19 +762,24 @@ class VipSession():
                 print("-------------------------")
                 print(f"Session <{self._session_name}> is not yet over.")
             return self
+        # Function to check path existence on VIP (without call to VIP for the removed session folder)
+        def still_exists(vip_path) -> bool:
+            if (vip_path.rstrip("/") + "/").startswith(path.rstrip("/") + "/"):
+                return False
+            return vip.exists(vip_path)
         # Check if the input data have been erased (this is not the case when get_inputs have been used)
         success = True # Will remain True if all data have been removed
         warning_msg = "" # Will grow up in case of failure
         finished = False # Will become True when workflow status are set to "Remove"
-        if vip.exists(self._vip_input_dir):
+        if still_exists(self._vip_input_dir):
             # Removal failed
             if force_remove:
                 # Try to force removal
-                success = delete_path(self._vip_input_dir, verbose)
+                success = self._delete_and_check(self._vip_input_dir, verbose=verbose)
                 # Remove the parent directory if it is empty
                 parent = self._vip_dirname(self._vip_input_dir)
                 if not vip.list_content(parent):
-                    delete_path(parent, verbose)
+                    self._delete_and_check(parent, verbose=verbose)
             else:
                 success = False
             # Warning message
@@ -680,14 +787,14 @@ class VipSession():
                 warning_msg += ">> The input data were not removed: they may be shared with another session ?"
                 warning_msg += f"\n\tRun: finish(force_remove=True) to force their removal.\n"
         # Check if the output data have been erased
-        if vip.exists(self._vip_output_dir):
+        if still_exists(self._vip_output_dir):
             if force_remove:
                 # Try to force removal
-                success = delete_path(self._vip_output_dir, verbose)
+                success = self._delete_and_check(self._vip_output_dir, verbose=verbose)
                 # Remove the parent directory if it is empty
                 parent = self._vip_dirname(self._vip_output_dir)
                 if not vip.list_content(parent):
-                    delete_path(parent, verbose)
+                    self._delete_and_check(parent, verbose=verbose)
             else:
                 success = False
             # Warning message
@@ -697,7 +804,7 @@ class VipSession():
         else:
             # Removal was successful: update the worflow inventory to avoid dead links in future downloads
             for wid in self._workflows:
-                self._workflows[wid]["status"] = "Removed"
+                self._set_workflow(wid, {"status": "Removed"})
             # Update flag
             finished = True
         # Display success
@@ -822,82 +929,135 @@ class VipSession():
 
     # Function to upload all files from a local directory
     @classmethod
-    def _upload_dir(cls, local_path, vip_path, verbose=True) -> list:
+    def _upload_dir(cls, local_path, vip_path, verbose=True, max_workers=8) -> list:
         """
         Uploads all files in `local_path` to `vip_path` (if needed).
+        The whole tree is scanned first, then files are uploaded in parallel, 
+        at most `max_workers` at a time (capped by the size of the connection pool).
         Displays what it does if `verbose` is set to True.
         Returns a list of files which failed to be uploaded on VIP.
         """
-        # Scan the local directory
-        assert os.path.exists(local_path), f"{local_path} does not exist."
-        # First display
-        if verbose: print(f"Cloning: {local_path} ", end="... ")
-        # Scan
-        local_elements = os.listdir(local_path)
-        # Look for subdirectories
-        subdirs = [
-            elem for elem in local_elements 
-            if os.path.isdir(os.path.join(local_path, elem))
-        ]
-        # Scan the distant directory and look for files to upload
-        if cls._make_dir(vip_path, location="vip"):
-            # The distant directory did not exist before call
-            # -> upload all the data (no scan to save time)
-            files_to_upload = [
-                os.path.join(local_path, elem)
-                for elem in local_elements
-                if os.path.isfile(os.path.join(local_path, elem))
-            ]
-            if verbose:
-                print("Created on VIP.")
-                if files_to_upload:
-                    print(f" {len(files_to_upload)} files to upload.")
-        else: # The distant directory already exists
-            # -> scan it to check if there are more files to upload
-            vip_filenames = {
-                cls._vip_basename(element["path"]) for element in vip.list_elements(vip_path)
-            }
-            # Get the files to upload
-            files_to_upload = [
-                os.path.join(local_path, elem) for elem in local_elements
-                if os.path.isfile(os.path.join(local_path, elem)) and (elem not in vip_filenames)
-            ]
-            # Update the display
-            if verbose:
-                if files_to_upload: 
-                    print(f"\n\tVIP clone already exists and will be updated with {len(files_to_upload)} files.")
-                else:
-                    print("Already on VIP.")
-        # Upload the files
+        # Scan the local tree and its VIP clone to get the files to upload
+        files_to_upload = cls._files_to_upload(local_path, vip_path, verbose)
+        # Upload the files (all directories at once, displayed by order of completion)
         nFile = 0
         failures = []
-        for local_file in files_to_upload :
-            local_filename = os.path.basename(local_file)
-            nFile+=1
-            # Display the current file
-            if verbose:
-                print(f"\t[{nFile}/{len(files_to_upload)}] Uploading file: {local_filename} ...", end=" ")
-            # Upload the file on VIP
-            vip_file = cls._vip_path_join(vip_path, local_filename) # file path on VIP
-            if cls._upload_file(local_path=local_file, vip_path=vip_file):
-                # Upload was successful
-                if verbose: print("Done.")
-            else:
-                # Update display
-                if verbose: print(f"\n(!) Something went wrong during the upload.")
-                # Update missing files
-                failures.append(local_file)
-        # Recurse this function over sub-directories
-        for subdir in subdirs:
-            failures += cls._upload_dir(
-                local_path=os.path.join(local_path, subdir),
-                vip_path=cls._vip_path_join(vip_path, subdir),
-                verbose=verbose
-            )
+        if files_to_upload:
+            with ThreadPoolExecutor(max_workers=min(max_workers, cls._MAX_THREADS, len(files_to_upload))) as executor:
+                futures = {
+                    executor.submit(cls._upload_file, local_path=local_file, vip_path=vip_file): local_file 
+                    for local_file, vip_file in files_to_upload
+                }
+                for future in as_completed(futures):
+                    local_file = futures[future]
+                    nFile+=1
+                    done = future.result()
+                    # Display the current file (written at once)
+                    if verbose:
+                        print(
+                            f"\t[{nFile}/{len(files_to_upload)}] Uploading file: {local_file} ...",
+                            "Done." if done # Upload was successful
+                            else "\n(!) Something went wrong during the upload."
+                        )
+                    # Update missing files
+                    if not done:
+                        failures.append(local_file)
         # Return the list of failures
         return failures
     # ------------------------------------------------
 
+    # Function to list the files to upload from a local directory
+    @classmethod
+    def _files_to_upload(cls, local_path, vip_path, verbose=True) -> list:
+        """
+        Scans `local_path` and its clone in `vip_path`, level by level.
+        Creates the missing directories on VIP.
+        Displays what it does if `verbose` is set to True.
+        Returns a list of (local path, VIP path) for each file to upload on VIP.
+        """
+        # Scan the local directory
+        assert os.path.exists(local_path), f"{local_path} does not exist."
+        # Function to make (or scan) the VIP clone of a local directory
+        def scan_vip_dir(vip_dir, parent_created) -> dict:
+            # Returns None if `vip_dir` was created, or the file names it contains with their size
+            if parent_created is None:
+                # Root directory -> its parents may be missing as well
+                is_new = bool(cls._make_dir(vip_dir, location="vip"))
+            elif parent_created:
+                # The parent was just created -> no VIP check to save time
+                is_new = True
+            else:
+                # The parent already exists -> no search for missing parents
+                try:
+                    is_new = not vip.is_dir(vip_dir)
+                except RuntimeError as vip_error:
+                    cls._handle_vip_error(vip_error)
+            if is_new:
+                if parent_created is not None:
+                    assert vip.create_dir(vip_dir), f"Could not make directory: '{vip_dir}' on VIP."
+                return None
+            else:
+                return {
+                    cls._vip_basename(element["path"]): element.get("size") 
+                    for element in vip.list_elements(vip_dir)
+                }
+        # Browse the tree level by level (parents are made on VIP before their children)
+        files_to_upload = []
+        level = [(local_path, vip_path, None)] # (local directory, VIP directory, parent created / unknown)
+        with ThreadPoolExecutor(max_workers=cls._MAX_THREADS) as executor:
+            while level:
+                # Scan all VIP clones of this level at once
+                vip_scans = executor.map(lambda node: scan_vip_dir(*node[1:]), level)
+                next_level = []
+                for (local_dir, vip_dir, _), vip_files in zip(level, vip_scans):
+                    # First display
+                    if verbose: print(f"Cloning: {local_dir} ", end="... ")
+                    # Scan (file types are given by the directory listing: no extra system call)
+                    subdirs, local_files = [], []
+                    with os.scandir(local_dir) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                subdirs.append(entry.name)
+                            elif entry.is_file():
+                                local_files.append(entry)
+                    # Look for files to upload
+                    if vip_files is None:
+                        # The distant directory did not exist before call
+                        # -> upload all the data (no scan to save time)
+                        new_files = [entry.name for entry in local_files]
+                        if verbose:
+                            print("Created on VIP.")
+                            if new_files:
+                                print(f" {len(new_files)} files to upload.")
+                    else: # The distant directory already exists
+                        # -> check if there are more (or modified) files to upload
+                            # (the local size is read only for files that exist on VIP)
+                        new_files = [
+                            entry.name for entry in local_files
+                            if entry.name not in vip_files 
+                            or vip_files[entry.name] not in (None, entry.stat().st_size)
+                        ]
+                        # Update the display
+                        if verbose:
+                            if new_files: 
+                                print(f"\n\tVIP clone already exists and will be updated with {len(new_files)} files.")
+                            else:
+                                print("Already on VIP.")
+                    # Local and VIP paths of the files to upload
+                    files_to_upload += [
+                        (os.path.join(local_dir, elem), cls._vip_path_join(vip_dir, elem))
+                        for elem in new_files
+                    ]
+                    # Sub-directories are scanned with the next level
+                    next_level += [
+                        (os.path.join(local_dir, subdir), cls._vip_path_join(vip_dir, subdir), vip_files is None)
+                        for subdir in subdirs
+                    ]
+                level = next_level
+        # Return the files to upload
+        return files_to_upload
+    # ------------------------------------------------
+
     # Function to upload a single file on VIP
     @classmethod
     def _upload_file(cls, local_path, vip_path) -> bool:
@@ -905,10 +1065,11 @@ class VipSession():
         Uploads a single file in `local_path` to `vip_path`.
         Returns a success flag.
         """
-        # Check
-        assert os.path.exists(local_path), f"{local_path} does not exist."
-        # Upload
-        done = vip.upload(local_path, vip_path)
+        # Upload (file existence is checked when the file is opened, to save time)
+        try:
+            done = vip.upload(local_path, vip_path)
+        except FileNotFoundError:
+            done = False
         # Return
         return done
     # ------------------------------------------------   
@@ -926,6 +1087,104 @@ class VipSession():
         return done
     # ------------------------------------------------    
 
+    # Function to download a single output file and extract it if needed
+    @classmethod
+    def _download_output(cls, vip_path, local_path, extract=False) -> tuple:
+        """
+        Downloads a single file in `vip_path` to `local_path`.
+        If `extract` is True, replaces the downloaded archive by its content.
+        Returns a tuple of flags: (download success, extraction success or None).
+        """
+        # Extract the archive while it is downloaded (no archive written on disk)
+        if extract:
+            flags = cls._stream_extract_archive(vip_path, local_path)
+            if flags is not None:
+                return flags
+        # Otherwise (or after a transfer error), download the file and extract it afterwards
+        if not cls._download_file(vip_path=vip_path, local_path=local_path):
+            return False, None
+        # Extract archive content in the same thread, while other files are downloading
+        return True, (cls._extract_archive(local_path) if extract else None)
+    # ------------------------------------------------
+
+    # Method to extract content from a tarball on VIP, while it is downloaded
+    @classmethod
+    def _stream_extract_archive(cls, vip_path, local_path):
+        """
+        Streams GZIP file `vip_path` from VIP servers. If it is a tarball, extracts its content 
+        in a directory `local_path` without writing the archive on disk. 
+        Otherwise, saves the file as is in `local_path`.
+        Returns a tuple of flags: (download success, extraction success),
+        or None if the transfer failed and the file should be downloaded again.
+        Local errors (disk, corrupted archive) are reported without downloading again.
+        """
+        # Open the stream
+        try:
+            stream = vip.download_stream(vip_path)
+        except cls._TRANSFER_ERRORS:
+            return None
+        if stream is None: # Error from VIP (a plain download would fail the same way)
+            return False, None
+        # Extract in a temporary directory, until the archive is complete
+        tmp_dir = local_path + ".tmp"
+        is_tarball = False
+        with stream:
+            try:
+                # Check the first header without consuming the stream
+                buffered = io.BufferedReader(stream, buffer_size=cls._TAR_BUFSIZE)
+                is_tarball = cls._is_tarball(buffered.peek(cls._TAR_BUFSIZE))
+                if is_tarball:
+                    os.makedirs(tmp_dir, exist_ok=True) # even if the archive is empty
+                    with tarfile.open(
+                        fileobj=buffered, mode="r|gz", bufsize=cls._TAR_BUFSIZE, copybufsize=cls._TAR_BUFSIZE
+                    ) as tgz:
+                        tgz.extractall(path=tmp_dir)
+                    os.rename(tmp_dir, local_path)
+                else:
+                    # Not a tarball: save the stream as a plain file
+                    with open(local_path, "wb") as out_file:
+                        shutil.copyfileobj(buffered, out_file, cls._TAR_BUFSIZE)
+                return True, is_tarball
+            except cls._TRANSFER_ERRORS:
+                # Remove the partial data and download again
+                cls._remove_partial(tmp_dir, local_path, is_tarball)
+                return None
+            except (OSError, tarfile.TarError, zlib.error):
+                # Remove the partial data and report the failure
+                cls._remove_partial(tmp_dir, local_path, is_tarball)
+                return (True, False) if is_tarball else (False, None)
+    # ------------------------------------------------
+
+    # Function to remove the partial data of an interrupted download
+    @staticmethod
+    def _remove_partial(tmp_dir, local_path, is_tarball) -> None:
+        """
+        Removes the temporary extraction directory `tmp_dir`, 
+        or the partial file `local_path` if the download was not a tarball.
+        """
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not is_tarball and os.path.isfile(local_path):
+            try:
+                os.remove(local_path)
+            except OSError:
+                pass
+    # ------------------------------------------------
+
+    # Function to check if a GZIP file starts with a tar header
+    @staticmethod
+    def _is_tarball(head: bytes) -> bool:
+        """
+        Returns True if `head` (first bytes of a GZIP file) decompresses into a valid tar header.
+        (An empty tarball is not detected: its content cannot be told apart from zeros.)
+        """
+        try:
+            block = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head, tarfile.BLOCKSIZE)
+            tarfile.TarInfo.frombuf(block, tarfile.ENCODING, "surrogateescape")
+            return True
+        except (zlib.error, tarfile.HeaderError):
+            return False
+    # ------------------------------------------------
+
     # Method to create a directory leaf on the top of any path
     @classmethod
     def _make_dir(cls, path, location="local") -> str:
@@ -941,41 +1200,24 @@ class VipSession():
         # Case : the tree leaf already exists
             # Path location is checked by the way, 
             # along with user connexion with VIP (if needed).
-        if location == "local": 
-            exists = os.path.isdir(path)
-        elif location == "vip":
-            try:
-                exists = vip.is_dir(path)
-            except RuntimeError as vip_error:
-                cls._handle_vip_error(vip_error)
-        else: raise NotImplementedError(f"Unknown location: {location}")
+        if location not in cls._IS_DIR: 
+            raise NotImplementedError(f"Unknown location: {location}")
+        try:
+            exists = cls._IS_DIR[location](path)
+        except RuntimeError as vip_error:
+            cls._handle_vip_error(vip_error)
         if exists : return ""
-        # Find the 1rst non-existent directory in the arborescence
+        # Find the non-existent directories in the arborescence
         path = path.rstrip("/") # to avoid errors with `dirname`
-        first_node = cls._first_missing(path)
+        missing_nodes = cls._missing_nodes(path, location)
+        first_node = missing_nodes[0]
         # Make the path from there
         if location == "local":
             # Create the full arborescence locally
             os.makedirs(path, exist_ok=True)
         else: 
-            # Create the first node on VIP
-            assert vip.create_dir(first_node), f"Could not make directory: '{first_node}' on VIP."
-            # Make the other directories one by one
-            dir_to_make = first_node
-            while dir_to_make != path:
-                # Find the next directory to make
-                dir_to_make = cls._vip_path_join(
-                    # Current node:
-                    dir_to_make,
-                    # Next node:             
-                    (path
-                        # get the rest of the path (without heading "/")
-                        .replace(dir_to_make,"", 1).lstrip("/")
-                        # get the first node
-                        .split("/")[0]
-                    )
-                )
-                # Make the directory
+            # Make the directories one by one on VIP
+            for dir_to_make in missing_nodes:
                 assert vip.create_dir(dir_to_make), \
                     f"Could not make directory: '{dir_to_make}' on VIP."
         # Return : 
@@ -990,25 +1232,44 @@ class VipSession():
             )  
     
     @classmethod
-    def _first_missing(cls, path: str) -> str:
-        """
-        Returns the first non-existent node of `path`.
-        """
-        # Ensure there is no trailing "/" to avoid errors with `dirname`
-        if path == "/":
-            return path
-        path = path.rstrip("/")
-        # Scan the parent directory (with the relevant method)
-        parent = cls._vip_dirname(path) if path.startswith("/vip") else os.path.dirname(path) 
-        # Case : parent = path root or current directory
-        if not parent :
-            return path
-        # Case : the parent directory exists
-        elif (parent.startswith("/vip") and vip.is_dir(parent)) or os.path.isdir(parent):
-            return path
-        # Case : the parent directory does not exist
-        else: 
-            return cls._first_missing(parent)
+    def _missing_nodes(cls, path: str, location="local") -> list:
+        """
+        Returns the non-existent directories of `path` (which must not exist),
+        ordered from the first missing node to `path` itself.
+
+        The parent of `path` is checked first, since it usually exists (1 check).
+        Otherwise, since a directory cannot exist without its parents, the first missing node
+        is found by binary search over the other parents of `path` (O(log(depth)) checks).
+        """
+        # Choose the relevant methods
+        dirname = cls._vip_dirname if location == "vip" else os.path.dirname
+        is_dir = cls._IS_DIR[location]
+        # List the parents of `path` (the root directory is assumed to exist)
+        nodes = [path]
+        while True:
+            parent = dirname(nodes[-1])
+            if (not parent) or (parent == "/") or (parent == nodes[-1]):
+                break
+            nodes.append(parent)
+        # Function to check a node with interpretation of VIP errors
+        def node_exists(node) -> bool:
+            try:
+                return is_dir(node)
+            except RuntimeError as vip_error:
+                cls._handle_vip_error(vip_error)
+        # Check the parent first: only `path` is missing in most cases
+        if len(nodes) < 2 or node_exists(nodes[1]):
+            return nodes[:1]
+        # Binary search for the first existing parent: nodes[:first] do not exist
+        first, last = 2, len(nodes)
+        while first < last:
+            middle = (first + last) // 2
+            if node_exists(nodes[middle]):
+                last = middle
+            else:
+                first = middle + 1
+        # Return the missing directories, parents first
+        return nodes[first-1::-1]
     # ------------------------------------------------
 
     # Method to extract content from a tarball
@@ -1019,28 +1280,28 @@ class VipSession():
         and extracted content.
         Returns success flag.
         """
-        # Check the correct format
-        if not tarfile.is_tarfile(local_file):
-            return False
-        # Rename current archive
-        archive = os.path.join(os.path.dirname(local_file), "tmp.tgz")
-        os.rename(local_file, archive)
-        # Create a new directory to store archive content
-        cls._make_dir(local_file)
-        # Extract archive content
+        # Extract in a temporary directory, reading the archive once (streaming mode)
+        tmp_dir = local_file + ".tmp"
+        archive = local_file + ".tmp.tgz"
         try:
-            with tarfile.open(archive) as tgz:
-                tgz.extractall(path=local_file)
+            os.makedirs(tmp_dir, exist_ok=True) # even if the archive is empty
+            with tarfile.open(
+                local_file, mode="r|*", bufsize=cls._TAR_BUFSIZE, copybufsize=cls._TAR_BUFSIZE
+            ) as tgz:
+                tgz.extractall(path=tmp_dir)
+            # Replace the archive by the temporary directory (the archive is removed last)
+            os.rename(local_file, archive)
+            try:
+                os.rename(tmp_dir, local_file)
+            except OSError:
+                os.rename(archive, local_file)
+                raise
+            os.remove(archive)
             success = True
         except:
+            # Keep the archive and remove the partial content
+            shutil.rmtree(tmp_dir, ignore_errors=True)
             success = False
-        # Deal with the temporary archive
-        if success:
-            # Remove the archive
-            os.remove(archive)
-        else:
-            # Rename the archive
-            os.rename(archive, local_file)
         # Return the flag
         return success
     # ------------------------------------------------
@@ -1055,60 +1316,58 @@ class VipSession():
         If `verbose` is True, interprets the result to the user.
         """
         # Initiate status report
-        report={}
-        # Browse workflows
-        for wid in self._workflows:
-            # Get status
-            status = self._workflows[wid]["status"]
-            # Update the report
-            if status in report:
-                # update status
-                report[status].append(wid)
-            else:
-                # create status
-                report[status] = [wid]
+        report = defaultdict(list)
+        # Browse workflows (from the status inventory only)
+        for wid, status in self._workflow_status.items():
+            report[status].append(wid)
+        report = dict(report)
         # Interpret the report to the user
         if verbose:
+            # Number of workflows
+            total = len(self._workflow_status)
+            # Buffer the display to write it at once
+            buf = io.StringIO()
             # Function to print a detailed worfklow list
             def detail(worfklows: list): 
                 for wid in worfklows:
-                    print("\t", wid, ", started on:", self._workflows[wid]["start"])
+                    print("\t", wid, ", started on:", self._workflows[wid]["start"], file=buf)
             # Browse status
             for status in report:
                 # Display running executions
                 if status == 'Running':
                     # check if every workflow is running
-                    if len(report[status])==len(self._workflows):
-                        print(f"All executions are currently running on VIP.")
+                    if len(report[status])==total:
+                        print(f"All executions are currently running on VIP.", file=buf)
                     else: # show details
-                        print(f"{len(report[status])} execution(s) is/are currently running on VIP:")
+                        print(f"{len(report[status])} execution(s) is/are currently running on VIP:", file=buf)
                         detail(report[status])
                 # Display successful executions
                 elif status == 'Finished':
                     # check if every run was successful
-                    if len(report[status])==len(self._workflows):
-                        print(f"All executions ({len(report[status])}) ended with success.")
+                    if len(report[status])==total:
+                        print(f"All executions ({len(report[status])}) ended with success.", file=buf)
                     else: # show details
-                        print(f"{len(report[status])} execution(s) ended with success:")
+                        print(f"{len(report[status])} execution(s) ended with success:", file=buf)
                         detail(report[status])
                 # Display executions with removed data
                 elif status == 'Removed':
                     # check if every run was removed
-                    if len(report[status])==len(self._workflows):
-                        print("This session is over.")
-                        print("All output data were removed from VIP servers.")
+                    if len(report[status])==total:
+                        print("This session is over.", file=buf)
+                        print("All output data were removed from VIP servers.", file=buf)
                     else: # show details
-                        print(f"Outputs from {len(report[status])} execution(s) were removed from VIP servers:")
+                        print(f"Outputs from {len(report[status])} execution(s) were removed from VIP servers:", file=buf)
                         detail(report[status])
                 # Display failed executions
                 else:
                     # check if every run had the same cause of failure:
-                    if len(report[status])==len(self._workflows):
-                        print(f"All executions ({len(report[status])}) ended with status:", status)
+                    if len(report[status])==total:
+                        print(f"All executions ({len(report[status])}) ended with status:", status, file=buf)
                     else: # show details
-                        print(f"{len(report[status])} execution(s) ended with status:", status)
+                        print(f"{len(report[status])} execution(s) ended with status:", status, file=buf)
                         detail(report[status])
             # End of loop on report
+            print(buf.getvalue(), end="")
         # Return the report
         return report
     # ------------------------------------------------
@@ -1118,13 +1377,8 @@ class VipSession():
         Returns the number of workflows which are still running on VIP.
         (!) Requires prior call to self._update_workflows to avoid unnecessary connexions to VIP
         """
-        # Workflow count
-        count = 0
-        for wid in self._workflows:
-            # Update count
-            count += int(self._workflows[wid]["status"]=="Running")
-        # Return count
-        return count   
+        # Workflow count (maintained by `_set_workflow()`)
+        return self._status_counts["Running"]
     # ------------------------------------------------
 
     # Update all worflow information at once
@@ -1133,15 +1387,41 @@ class VipSession():
         Updates the status of each workflow. 
         Saves information in the session file if save_session is True.
         """
-        for wid in self._workflows:
-            # Check if workflow data have been removed
-            if self._workflows[wid]["status"] != "Removed":
-                # Recall execution info
-                self._workflows[wid] = self._get_exec_infos(wid)
+        # Workflows with data on VIP
+        pending = [wid for wid, status in self._workflow_status.items() if status != "Removed"]
+        # Recall execution info (all requests at once)
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(2*len(pending), self._MAX_THREADS)) as executor:
+                # Submit both requests of every workflow 
+                all_infos = [executor.submit(vip.execution_info, wid) for wid in pending]
+                all_files = [executor.submit(vip.get_exec_results, wid) for wid in pending]
+                # Update the inventory
+                try:
+                    for wid, infos, files in zip(pending, all_infos, all_files):
+                        self._set_workflow(wid, self._filter_exec_infos(infos.result(), files.result()))
+                except RuntimeError as vip_error:
+                    self._handle_vip_error(vip_error)
         # Save & return
         return self._save_session(verbose=False) if save_session else ""
     # ------------------------------------------------
 
+    # Update a single workflow in the inventory
+    def _set_workflow(self, workflow_id: str, infos: dict) -> None:
+        """
+        Updates the information of `workflow_id` in the workflow inventory, 
+        its status in the status inventory (`self._workflow_status`)
+        and the number of workflows per status (`self._status_counts`).
+        """
+        self._workflows.setdefault(workflow_id, {}).update(infos)
+        # Update the status count on status change
+        old_status, new_status = self._workflow_status.get(workflow_id), infos["status"]
+        if old_status != new_status:
+            if old_status is not None:
+                self._status_counts[old_status] -= 1
+            self._status_counts[new_status] += 1
+            self._workflow_status[workflow_id] = new_status
+    # ------------------------------------------------
+
     # Method to get useful information about a given workflow
     @classmethod
     def _get_exec_infos(cls, workflow_id: str) -> dict:
@@ -1159,6 +1439,13 @@ class VipSession():
         except RuntimeError as vip_error:
             cls._handle_vip_error(vip_error)
         # Return filtered information
+        return cls._filter_exec_infos(infos, files)
+    
+    @staticmethod
+    def _filter_exec_infos(infos: dict, files: list) -> dict:
+        """
+        Filters the execution information (`infos`) and results (`files`) returned by VIP.
+        """
         return {
             # Execution status (VIP notations)
             "status": infos["status"],
@@ -1168,16 +1455,51 @@ class VipSession():
                 ),
             # Returned files (filtered information)
             "outputs": [
-                {
-                    key: elem[key] 
-                    for key in ["path", "isDirectory", "size", "mimeType"]
-                    if key in elem
-                }
+                {key: elem[key] for key in VipSession._OUTPUT_KEYS if key in elem}
                 for elem in files
             ]
         }
     # ------------------------------------------------
     
+    # (A.6) Clean session data on VIP
+    #################################
+
+    # Function to delete a path on VIP with warning
+    @classmethod
+    def _delete_and_check(cls, path: str, timeout=300, verbose=True) -> bool:
+        """
+        Deletes `path` on VIP servers and waits until `path` is removed.
+        Gives up after `timeout` seconds.
+        Displays a warning in case of failure if `verbose` is True.
+        Returns a success flag.
+        """
+        done = vip.delete_path(path)
+        if not done: # Errors are handled by returning False in `vip.delete_path()`
+            msg = f"\n(!) '{path}' could not be removed from VIP servers.\n"
+            msg += "Check your connection with VIP and path existence on VIP website.\n"
+            if verbose: print(msg)
+        else:
+            # Standby until path is indeed removed (give up after some time)
+            deadline = time.monotonic() + timeout
+            interval = 1 # polling interval in seconds (doubled at each check, up to 30s)
+            removed = not vip.exists(path)
+            while not removed and time.monotonic() < deadline:
+                # Small random jitter to avoid synchronized polls from parallel sessions
+                delay = interval + random.uniform(0, 0.5)
+                time.sleep(min(delay, max(0, deadline - time.monotonic())))
+                interval = min(2*interval, 30)
+                removed = not vip.exists(path)
+            # Check if the data have indeed been removed
+            if not removed:
+                # Display warning
+                msg = f"\n(!) '{path}' was queued for deletion, but still not removed after {timeout} seconds.\n"
+                msg += "Run finish() again later to end the process.\n"
+                if verbose: print(msg)
+                done = False
+        # Return success flag
+        return done 
+    # ------------------------------------------------
+
     ###################################
     # ($C) Backup / Resume Session Data 
     ###################################
@@ -1206,6 +1528,9 @@ class VipSession():
         - `workflows` (dict) Inventory of all worflows launched within the session.
             Each workflow is characterized by a status, a start date and a list of output files.
         """
+        # Forget the checked input settings if they may be affected
+        if not kwargs.keys().isdisjoint({"pipeline_id", "input_dir", "local_input_dir", "input_settings"}):
+            self._checked_settings.clear()
         # Set session name
         if "session_name" in kwargs:
             # check the session name
@@ -1231,12 +1556,18 @@ class VipSession():
         # Set VIP output path (no check)
         if "vip_output_dir" in kwargs:
             self._vip_output_dir = kwargs.pop("vip_output_dir")
+        # Forget the cached input & output directories
+        self.__dict__.pop("_input_dirs", None)
+        self.__dict__.pop("_output_dirs", None)
         # Set the Input Settings (depends on the new VIP Input Path)
         if "input_settings" in kwargs:
             self._input_settings = self._vip_input_settings(kwargs.pop("input_settings"))
         # Set Worflows Inventory (no check)
         if "workflows" in kwargs:
             self._workflows = kwargs.pop("workflows")
+            # Status inventory, for fast scans
+            self._workflow_status = {wid: self._workflows[wid]["status"] for wid in self._workflows}
+            self._status_counts = Counter(self._workflow_status.values())
         # Check unknown properties
         assert not kwargs, f"Unknown propertie(s) : {', '.join(kwargs.keys())}."
         # Return for method cascading
@@ -1278,11 +1609,20 @@ class VipSession():
             "input_settings": self._input_settings,
             # Soon: hardware information ?
         }
-        # Make the ouput directory if it does not exist
-        is_new = self._make_dir(self._local_output_dir)
-        # Save the data in JSON format
-        with open(file, "w") as outfile:
-            json.dump(vip_data, outfile, indent=4)
+        # Serialize the data in JSON format
+        content = json.dumps(vip_data, indent=4)
+        # Skip the writing if the file is already up to date
+        if self._last_save == (file, content) and os.path.isfile(file):
+            is_new = False
+        else:
+            # Make the ouput directory if it does not exist
+            is_new = self._make_dir(self._local_output_dir)
+            # Save the data in a temporary file, then replace the session file at once
+            tmp_file = file + ".tmp"
+            with open(tmp_file, "w") as outfile:
+                outfile.write(content)
+            os.replace(tmp_file, file)
+            self._last_save = (file, content)
         # Display
         if verbose:
             print("\nSession properties were saved in:")
@@ -1334,9 +1674,19 @@ class VipSession():
         # Check the input type
         assert isinstance(my_settings, dict), \
             "Please provide input parameters in dictionnary shape."
-        # Convert local paths into VIP paths
+        # Convert local paths into VIP paths (each distinct path is resolved once)
+        vip_paths = {}
+        def convert(value):
+            if isinstance(value, list):
+                return [convert(element) for element in value]
+            elif isinstance(value, str):
+                if value not in vip_paths:
+                    vip_paths[value] = self._get_vip_input_path(value)
+                return vip_paths[value]
+            else: # raises the appropriate error
+                return self._get_vip_input_path(value)
         vip_settings = {
-                input: self._get_vip_input_path(my_settings[input])
+                input: convert(my_settings[input])
                 for input in my_settings
             }
         # Set the results directory
@@ -1360,12 +1710,18 @@ class VipSession():
             assert self._local_input_dir, "Attribute `_local_input_dir` is unset."
             # Create Path instances to handle the path accounting for the local OS
                 # We use absolute path since relative ones are unpredictable
-            in_path = Path(input_path).resolve()
-            local_dir = Path(self._local_input_dir).resolve()
+            in_path = Path(input_path)
+            local_dir, vip_dir, given_dir = self._input_dirs
+            # Fast path: `input_path` was written from `self._local_input_dir` (no resolution needed)
+            if ".." not in in_path.parts and in_path.is_relative_to(given_dir):
+                return str(vip_dir / in_path.relative_to(given_dir))
+            # Resolve the path, unless it is already absolute & directly inside the (resolved) input directory
+            if not (in_path.is_absolute() and ".." not in in_path.parts and in_path.is_relative_to(local_dir)):
+                in_path = in_path.resolve()
             # Check if `input_path` is indeed a local input path
             if in_path.is_relative_to(local_dir):
                 # Replace `local_input_dir`" by `vip_input_dir` in the path
-                new = PurePosixPath(self._vip_input_dir) / in_path.relative_to(local_dir)
+                new = vip_dir / in_path.relative_to(local_dir)
                 # Return the string version
                 return str(new)
             else:
@@ -1385,24 +1741,17 @@ class VipSession():
         Converts a VIP path in local format for VIP outputs. 
         `vip_output_path` can be a single string or a list of strings.
         """
-        # List of forbidden characters in Windows paths
-        invalid_for_windows = '<>:"?* '
         # If vip_output_path is a string : convert the path
         if isinstance(vip_output_path, str):
-            # Create Path instances to handle the path accounting for the local OS
+            # Get the VIP prefix to replace and the local Path instance to use instead
                 # (Both paths are already absolute)
-            vip_out_path = PurePosixPath(vip_output_path)
-            vip_out_dir = PurePosixPath(self._vip_output_dir)
+            vip_prefix, local_out_dir = self._output_dirs
             # Check if the input is indeed a VIP output path
-            if vip_out_path.is_relative_to(vip_out_dir):
+            if vip_output_path.startswith(vip_prefix):
                 # Replace `vip_output_dir`" by `local_output_dir` in the path
-                new = Path(self._local_output_dir) / vip_out_path.relative_to(vip_out_dir)
-                # Replace forbidden characters by '-' if current OS is windows
-                new_str = str(new)
-                if isinstance(new, WindowsPath):
-                    for char in invalid_for_windows: new_str = new_str.replace(char, '-')
-                # Return
-                return new_str
+                new = local_out_dir.joinpath(*vip_output_path[len(vip_prefix):].split("/"))
+                # Replace forbidden characters by '-' if current OS is windows (single pass)
+                return str(new).translate(self._WINDOWS_CHARS) if self._IS_WINDOWS else str(new)
             else:
                 # This is not a a VIP output path : return the value
                 return vip_output_path
@@ -1414,6 +1763,30 @@ class VipSession():
             raise TypeError(f"The folllowing object:\n\t{vip_output_path}\nshould be a string or a list of strings.")
     # ------------------------------------------------
 
+    # Input directories in the format used for each input file
+    @cached_property
+    def _input_dirs(self) -> tuple:
+        """
+        Tuple (`self._local_input_dir`, `self._vip_input_dir`, `self._local_input_dir`) as Path instances,
+        the first local directory being resolved once and the last one left as is. 
+        Cached until one of these directories is updated with `_set()`.
+        """
+        local_dir = Path(self._local_input_dir)
+        return local_dir.resolve(), PurePosixPath(self._vip_input_dir), local_dir
+    # ------------------------------------------------
+
+    # Output directories in the format used for each output file
+    @cached_property
+    def _output_dirs(self) -> tuple:
+        """
+        Tuple (VIP prefix, local Path instance) for the output directories:
+        - `self._vip_output_dir` as a string ending with "/";
+        - `self._local_output_dir` as a Path instance.
+        Cached until one of these directories is updated with `_set()`.
+        """
+        return self._vip_output_dir.rstrip("/") + "/", Path(self._local_output_dir)
+    # ------------------------------------------------
+
     # Functions to manipulate VIP paths like os.path
     @classmethod
     def _vip_basename(cls, vip_path: str) -> str:
@@ -1462,13 +1835,8 @@ class VipSession():
         # Input
         if not name:
             name = self._session_name
-        # Green Flag
-        ok_name = True
-        # Criterion
-        for letter in name:
-            ok_name &= letter.isalnum() or (letter in "_- ")
-        # Error message
-        if not ok_name:
+        # Criterion (alphanumeric characters, "_", "-" and spaces)
+        if not self._SESSION_NAME_RE.fullmatch(name):
             raise ValueError("Session name must contain only alphanumeric characters, spaces and hyphens ('-', '_').")
     # ------------------------------------------------    
 
@@ -1478,13 +1846,13 @@ class VipSession():
         Checks if the pipeline identifier `pipeline_id` is available for this session.
         Raises ValueError otherwise.
         If `pipeline_id` is not provided, checks instance attribute.
-        (!) Requires prior call to VipSession.init() to avoid useless connexion
+        (!) Requires prior call to VipSession.init(): the list of pipelines is loaded at first check.
         """
         # Default value
         if not pipeline_id:
             pipeline_id = self._pipeline_id
         # Check pipeline identifier
-        if not (pipeline_id and (pipeline_id in VipSession._PIPELINES)):
+        if not (pipeline_id and (pipeline_id in self._pipelines_set())):
             msg="Please provide a valid pipeline identifier.\n"
             if not VipSession._PIPELINES:
                 msg+="Run VipSession.init() with your API key to print available pipeline identifiers."
@@ -1493,6 +1861,105 @@ class VipSession():
             raise ValueError(msg)
     # ------------------------------------------------
 
+    # Function to get a pipeline definition from the cache or from VIP
+    @classmethod
+    def _get_pipeline_def(cls, pipeline_id: str) -> dict:
+        """
+        Returns the definition of `pipeline_id`.
+        Definitions are cached in memory and in `cls._CACHE_DIR` (for `cls._CACHE_TTL` seconds),
+        since they do not change for a given pipeline version.
+        Delete the cache file to force a new download from VIP.
+        """
+        # Definition already loaded in this process
+        if pipeline_id in cls._PIPELINE_DEFS:
+            return cls._PIPELINE_DEFS[pipeline_id]
+        # Definition cached on this machine
+        cache_file = os.path.join(cls._CACHE_DIR, pipeline_id.replace("/", "_") + ".json")
+        try:
+            if time.time() - os.path.getmtime(cache_file) < cls._CACHE_TTL:
+                with open(cache_file, "r") as fid:
+                    cls._PIPELINE_DEFS[pipeline_id] = json.load(fid)
+                return cls._PIPELINE_DEFS[pipeline_id]
+        except OSError:
+            # Missing cache file: load the definition from VIP
+            pass
+        except ValueError:
+            # Corrupted cache file: discard it and load the definition from VIP
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+        # Definition loaded from VIP
+        try:
+            pipeline_def = vip.pipeline_def(pipeline_id)
+        except RuntimeError as vip_error:
+            cls._handle_vip_error(vip_error)
+        cls._PIPELINE_DEFS[pipeline_id] = pipeline_def
+        # Update the cache file (atomic write to avoid partial files)
+            # (unique temporary file, in case several processes write the same definition)
+        tmp_file = None
+        try:
+            os.makedirs(cls._CACHE_DIR, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(dir=cls._CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w") as outfile:
+                json.dump(pipeline_def, outfile)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # The cache is optional: only remove the temporary file
+            if tmp_file and os.path.exists(tmp_file):
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+        return pipeline_def
+    # ------------------------------------------------
+
+    # Function to get the parameter names and types of a pipeline
+    @classmethod
+    def _get_pipeline_meta(cls, pipeline_id: str) -> dict:
+        """
+        Returns the parameters of `pipeline_id`, computed once per pipeline:
+        - `required`: frozenset of mandatory parameter names;
+        - `known`: frozenset of all parameter names;
+        - `types`: dictionnary of parameter types.
+        """
+        if pipeline_id not in cls._PIPELINE_META:
+            # Browse the pipeline parameters once
+            required, types = set(), {}
+            for param in cls._get_pipeline_def(pipeline_id)["parameters"]:
+                types[param["name"]] = param["type"]
+                if not param["isOptional"] and (param["defaultValue"] == "$input.getDefaultValue()"):
+                    required.add(param["name"])
+            cls._PIPELINE_META[pipeline_id] = {
+                "required": frozenset(required),
+                "known": frozenset(types),
+                "types": types,
+            }
+        return cls._PIPELINE_META[pipeline_id]
+    # ------------------------------------------------
+
+    # Function that returns the available pipelines, loading them at first call
+    @classmethod
+    def _pipelines(cls, force_refresh=False) -> list:
+        """
+        Returns the list of available pipelines (`cls._PIPELINES`).
+        The list is loaded from VIP only if it is empty, older than `cls._PIPELINES_TTL` seconds,
+        or if `force_refresh` is True.
+        """
+        if (force_refresh or not cls._PIPELINES 
+            or time.monotonic() - cls._PIPELINES_TIME >= cls._PIPELINES_TTL):
+            cls._get_available_pipelines()
+        return cls._PIPELINES
+
+    @classmethod
+    def _pipelines_set(cls, force_refresh=False) -> frozenset:
+        """
+        Same as `_pipelines()`, in a frozenset for O(1) membership tests.
+        """
+        cls._pipelines(force_refresh)
+        return cls._PIPELINES_SET
+    # ------------------------------------------------
+
     # Function that lists available pipeline identifiers for a given VIP accout
     @classmethod
     def _get_available_pipelines(cls) -> list:
@@ -1508,6 +1975,8 @@ class VipSession():
             pipeline["identifier"] for pipeline in all_pipelines 
             if pipeline["canExecute"] is True 
         ]
+        cls._PIPELINES_SET = frozenset(cls._PIPELINES)
+        cls._PIPELINES_TIME = time.monotonic()
         return cls._PIPELINES
     # ------------------------------------------------
 
@@ -1527,6 +1996,9 @@ class VipSession():
         - Raises AssertionError if `input_settings` do not match pipeline requirements 
         or if any file does not exist. 
         - Raises RuntimeError if communication failed with VIP servers.
+        - Parameter names and types which passed all assertions are not checked again 
+        within this session, until the pipeline, the input directory, the input settings 
+        or the API key are updated. File existence is checked at each call.
         """
         # Check arguments & instance properties
         if not input_settings:
@@ -1536,33 +2008,50 @@ class VipSession():
         if not self._pipeline_id: 
             warn("Input settings could not be checked without a pipeline identifier.")
             return False
+        # Skip the format assertions if the same settings were already checked
+        checked_key = (self._INIT_COUNT, self._pipeline_id, self._local_input_dir, self._freeze(input_settings))
+        check_format = checked_key not in self._checked_settings
+        if not self._assert_input_settings(input_settings, check_format=check_format):
+            return False
+        self._checked_settings.add(checked_key)
+        # Ensure parameter "results-directory" is in line with instance attribute (vip_output_dir)
+        if "results-directory" in input_settings:
+            if input_settings["results-directory"] != self._vip_output_dir:
+                warn(
+                    f"Results directory has been updated according to the input settings.\n\
+                    Old path: {self._vip_output_dir}\n\
+                    New path: {input_settings['results-directory']}\n"
+                )
+                self._set(vip_output_dir=input_settings['results-directory'])
+        # Return True when all checks are complete
+        return True
+    # ------------------------------------------------         
+
+    # Run all assertions on the input settings (called by `_check_input_settings`)
+    def _assert_input_settings(self, input_settings: dict, check_format=True) -> bool:
+        """
+        Asserts that every input file exists and, if `check_format` is True,
+        that `input_settings` match the pipeline descriptor (parameter names and types).
+        Returns True if each assertion could be tested, False otherwise.
+        """
         # Get the true pipeline parameters
-        try :            
-            parameters = vip.pipeline_def(self._pipeline_id)["parameters"]
-        except RuntimeError as vip_error:
-            self._handle_vip_error(vip_error)
+        meta = self._get_pipeline_meta(self._pipeline_id)
         # PARAMETER NAMES -----------------------------------------------------------
-        # Check every required field is there 
-        missing_fields = (
-            # requested pipeline parameters
-            {param["name"] for param in parameters 
-                if not param["isOptional"] and (param["defaultValue"] == "$input.getDefaultValue()")} 
-            # current parameters in self 
-            - set(input_settings.keys()) 
-        )
-        assert not missing_fields, "Missing input parameters :\n" + ", ".join(missing_fields) 
-        # Check every input parameter is a valid field
-        unknown_fields = (
-            set(input_settings.keys()) # current parameters in self 
-            - {param["name"] for param in parameters} # pipeline parameters
-        )
-        assert unknown_fields <= {"results-directory"}, \
-            "Unkown input parameters :\n" + ", ".join(unknown_fields) # "results-directory" is specific to VIP
+        if check_format:
+            # Check every required field is there 
+            missing_fields = meta["required"] - input_settings.keys()
+            assert not missing_fields, "Missing input parameters :\n" + ", ".join(missing_fields) 
+            # Check every input parameter is a valid field
+            unknown_fields = input_settings.keys() - meta["known"]
+            assert unknown_fields <= {"results-directory"}, \
+                "Unkown input parameters :\n" + ", ".join(unknown_fields) # "results-directory" is specific to VIP
         # PARAMETER NAMES -----------------------------------------------------------
         # Check if an input directory has been set
         if not self._local_input_dir:
             warn("Input settings could not be fully checked without the input directory.")
             return False
+        # Resolved input directory (computed once for all files)
+        input_root = self._input_dirs[0]
         # Function to assert file existence
         def assert_exists(file): 
             if file.startswith("/vip"): # VIP path
@@ -1573,62 +2062,117 @@ class VipSession():
                 # The file must exist (`strict=True`) & belong to _local_input_dir (`is_relative_to()`)
                 try:
                     assert Path(file).resolve(strict=True)\
-                        .is_relative_to(Path(self._local_input_dir).resolve()),\
+                        .is_relative_to(input_root),\
                             f"The following file does not belong to this session's inputs:\n\t{file}"
                 except:
                     #Exception handled: caused by a Python version not supporting is_relative_to (which exists only from Python 3.9)
                     assert os.path.exists(file),\
                         f"The following file does not exist:\n\t{file}"
+        # Function to find a missing file on VIP among `files` (all requests at once)
+        def missing_on_vip(files: list) -> str:
+            if not files:
+                return ""
+            with ThreadPoolExecutor(max_workers=min(len(files), self._MAX_THREADS)) as executor:
+                futures = {executor.submit(vip.exists, file): file for file in files}
+                for future in as_completed(futures):
+                    if not future.result():
+                        # Cancel the remaining requests
+                        for other in futures: other.cancel()
+                        return futures[future]
+            return ""
         # Browse the input parameters
-        for param in parameters:
-            # Skip irrelevant inputs
-            if not param['name'] in input_settings:
-                continue
-            # Get input value
-            value = input_settings[param['name']]
+        for name, value in input_settings.items():
+            # Get the parameter type (None for "results-directory")
+            param_type = meta["types"].get(name)
             # Check files existence
-            if param["type"] == "File":
+            if param_type == "File":
                 # Case: single file
                 if isinstance(value, str):
                     assert_exists(value)
                 # Case : list of files
                 elif isinstance(value, list):
-                    for file in value : assert_exists(file)
+                    # VIP files
+                    missing = missing_on_vip([file for file in value if file.startswith("/vip")])
+                    assert not missing, f"The following file does not exist on VIP:\n\t{missing}"
+                    # Local files
+                    for file in value : 
+                        if not file.startswith("/vip"): assert_exists(file)
                 # Case : wrong format
                 else:
-                    raise TypeError(f"Parameter {param['name']} should be a path or a list of paths.")
-            # Check string format
-            elif param["type"] == "String":
-                # Case: single value
+                    raise TypeError(f"Parameter {name} should be a path or a list of paths.")
+            # Check string format (if not already checked)
+            elif param_type == "String" and check_format:
+                # Case: single value (nothing to check)
                 if isinstance(value, str):
-                    assert isinstance(value, str), f"{value} should be a string."
-                # Case : list of values
+                    pass
+                # Case : list of values (stops at the first wrong value)
                 elif isinstance(value, list):
-                    for val in value : 
-                        assert isinstance(val, str), f"{val} should be a string."
+                    wrong = next((val for val in value if not isinstance(val, str)), "")
+                    assert isinstance(wrong, str), f"{wrong} should be a string."
                 # Case : wrong format
                 else:
-                    raise TypeError(f"Parameter {param['name']} should be a string or a list of strings.")
+                    raise TypeError(f"Parameter {name} should be a string or a list of strings.")
             # Check other formats ?
             else: 
                 # TODO
                 pass
-        # Ensure parameter "results-directory" is in line with instance attribute (vip_output_dir)
-        if "results-directory" in input_settings:
-            if input_settings["results-directory"] != self._vip_output_dir:
-                warn(
-                    f"Results directory has been updated according to the input settings.\n\
-                    Old path: {self._vip_output_dir}\n\
-                    New path: {input_settings['results-directory']}\n"
-                )
-                self._set(vip_output_dir=input_settings['results-directory'])
         # Return True when all checks are complete
         return True
-    # ------------------------------------------------         
+    # ------------------------------------------------
+
+    # Function to make input settings hashable
+    @classmethod
+    def _freeze(cls, value):
+        """
+        Converts (recursively) dictionnaries and lists in `value` into tuples, 
+        and path-like objects into strings.
+        """
+        if isinstance(value, dict):
+            return tuple(sorted((key, cls._freeze(value[key])) for key in value))
+        elif isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(element) for element in value)
+        elif isinstance(value, os.PathLike):
+            return os.fspath(value)
+        else:
+            return value
+    # ------------------------------------------------
 
     # ($D.3) Interpret common API exceptions
     ########################################
 
+    # Interpretation of VIP error codes
+    _VIP_AUTH_ERROR = (
+        # "Bad credentials"  / "Full authentication required" / "Authentication error"
+        "Could not communicate with VIP.\n\t'{message}'"
+        + "\nRun VipSession.init() with a valid API key to handshake with VIP servers."
+    )
+    _VIP_INPUT_ERROR = (
+        #  Probably wrong values were fed in `vip.init_exec()`
+        "\n\t'{message}'"
+        + "\nPlease carefully check that session_name / pipeline_id / input_parameters "
+        + "are valid and do not contain any forbidden character."
+        + "\nIf this cannot be fixed, contact VIP support (vip-support@creatis.insa-lyon.fr)."
+    )
+    _VIP_LIMIT_ERROR = (
+        #  Maximum number of executions
+        "\n\t'{message}'"
+        + "\nPlease wait until current executions are over, "
+        + "or contact VIP support (vip-support@creatis.insa-lyon.fr) to increase this limit."
+    )
+    _VIP_ERRORS = {
+        "Error 8002": _VIP_AUTH_ERROR,
+        "Error 8003": _VIP_AUTH_ERROR,
+        "Error 8004": _VIP_AUTH_ERROR,
+        "Error 8000": _VIP_INPUT_ERROR,
+        "Error 2000": _VIP_LIMIT_ERROR,
+        "Error 2001": _VIP_LIMIT_ERROR,
+    }
+    # Unhandled runtime error
+    _VIP_ERROR_DEFAULT = (
+        "\n\t{message}"
+        + "\nIf this cannot be fixed, contact VIP support (vip-support@creatis.insa-lyon.fr)."
+    )
+
     # Function to handle VIP runtime errors and provide interpretation to the user
     # TODO add the following use cases:
         # - Connection to VIP expired during workflow monitoring
@@ -1639,36 +2183,10 @@ class VipSession():
         Rethrows a RuntimeError `vip_error` which occured in the VIP API,
         with interpretation depending on the error code.
         """
-        # Enumerate error cases
+        # Find the interpretation from the error code (first 10 characters, e.g. "Error 8002")
         message = vip_error.args[0]
-        if message.startswith("Error 8002") or message.startswith("Error 8003") \
-            or message.startswith("Error 8004"):
-            # "Bad credentials"  / "Full authentication required" / "Authentication error"
-            interpret = (
-                f"Could not communicate with VIP.\n\t'{message}'"
-                + "\nRun VipSession.init() with a valid API key to handshake with VIP servers."
-            )
-        elif message.startswith("Error 8000"):
-            #  Probably wrong values were fed in `vip.init_exec()`
-            interpret = (
-                f"\n\t'{message}'"
-                + "\nPlease carefully check that session_name / pipeline_id / input_parameters "
-                + "are valid and do not contain any forbidden character."
-                + "\nIf this cannot be fixed, contact VIP support (vip-support@creatis.insa-lyon.fr)."
-            )
-        elif message.startswith("Error 2000") or message.startswith("Error 2001"):
-            #  Maximum number of executions
-            interpret = (
-                f"\n\t'{message}'"
-                + "\nPlease wait until current executions are over, "
-                + "or contact VIP support (vip-support@creatis.insa-lyon.fr) to increase this limit."
-            )
-        else:
-            # Unhandled runtime error
-            interpret=(
-                f"\n\t{message}"
-                + "\nIf this cannot be fixed, contact VIP support (vip-support@creatis.insa-lyon.fr)."
-            )
+        interpret = VipSession._VIP_ERRORS.get(message[:10], VipSession._VIP_ERROR_DEFAULT)
+        interpret = interpret.format(message=message)
         # Display the error message
         raise RuntimeError(interpret)
     # ------------------------------------------------
@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 from os.path import join, dirname, exists
 
 
@@ -15,6 +16,16 @@ else:
     __certif = path
 del path
 
+# Chunk size for file transfers (4 MiB)
+__CHUNK_SIZE = 4 << 20
+
+# Maximum number of connections kept alive with VIP (parallel requests beyond it are not reused)
+MAX_CONNECTIONS = 16
+
+# HTTP session shared by all requests (keeps connections alive between calls)
+__session = requests.Session()
+__session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONNECTIONS))
+
 # -----------------------------------------------------------------------------
 def setApiKey(value)->bool:
     """
@@ -25,7 +36,7 @@ def setApiKey(value)->bool:
     head_test = {
                  'apikey': value,
                 }
-    rq = requests.put(url, headers=head_test, verify=__certif)
+    rq = __session.put(url, headers=head_test, verify=__certif)
     res = detect_errors(rq)
     if res[0]:
         if res[1] == 40101:
@@ -83,7 +94,7 @@ def create_dir(path)->bool:
     Return True if done, False otherwise
     """
     url = __PREFIX + 'path' + path
-    rq = requests.put(url, headers=__headers, verify=__certif)
+    rq = __session.put(url, headers=__headers, verify=__certif)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -116,7 +127,7 @@ def _path_action(path, action) -> requests.models.Response:
     """
     assert action in ['list', 'exists', 'properties', 'md5']
     url = __PREFIX + 'path' + path + '?action=' + action
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq
 
@@ -153,7 +164,7 @@ def delete_path(path)->bool:
     Return True if done, False otherwise
     """
     url = __PREFIX + 'path' + path
-    rq = requests.delete(url, headers=__headers, verify=__certif)
+    rq = __session.delete(url, headers=__headers, verify=__certif)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -175,8 +186,9 @@ def upload(path, where_to_save)->bool:
                 'apikey': __apikey,
                 'Content-Type': 'application/octet-stream',
               }
-    data = open(path, 'rb').read()
-    rq = requests.put(url, headers=headers, data=data, verify=__certif)
+    # The file is streamed from disk (not loaded in memory)
+    with open(path, 'rb') as data:
+        rq = __session.put(url, headers=headers, data=data, verify=__certif)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -192,28 +204,50 @@ def download(path, where_to_save):
         - where_to_save : on local computer
     """
     url = __PREFIX + 'path' + path + '?action=content'
-    rq = requests.get(url, headers=__headers, stream=True, verify=__certif)
+    rq = __session.get(url, headers=__headers, stream=True, verify=__certif)
     try:
         manage_errors(rq)
     except RuntimeError:
+        rq.close() # release the connection to the pool
         return False
     else:
-        with open(where_to_save, 'wb') as out_file:
-            out_file.write(rq.content)
+        # The content is written by chunks (not loaded in memory)
+        with rq, open(where_to_save, 'wb') as out_file:
+            for chunk in rq.iter_content(chunk_size=__CHUNK_SIZE):
+                out_file.write(chunk)
         return True
 
+# -----------------------------------------------------------------------------
+def download_stream(path):
+    """
+    Input:
+        - path: on VIP, something like "/vip/Home/RandomName.ext", content to dl
+
+    Return a file-like object streaming the content, None if an error occured
+    """
+    url = __PREFIX + 'path' + path + '?action=content'
+    rq = __session.get(url, headers=__headers, stream=True, verify=__certif)
+    try:
+        manage_errors(rq)
+    except RuntimeError:
+        rq.close() # release the connection to the pool
+        return None
+    else:
+        rq.raw.decode_content = True
+        return rq.raw
+
 ################################ EXECUTIONS ###################################
 # -----------------------------------------------------------------------------
 def list_executions()->list:
     url = __PREFIX + 'executions'
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.json()
 
 # -----------------------------------------------------------------------------
 def count_executions()->int:
     url = __PREFIX + 'executions/count'
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return int(rq.text)
 
@@ -229,14 +263,14 @@ def init_exec(pipeline, name="default", inputValues={}) -> str:
             'pipelineIdentifier': pipeline,
             "inputValues": inputValues
            }
-    rq = requests.post(url, headers=headers, json=data_, verify=__certif)
+    rq = __session.post(url, headers=headers, json=data_, verify=__certif)
     manage_errors(rq)
     return rq.json()["identifier"]
 
 # -----------------------------------------------------------------------------
 def execution_info(id_exec)->dict:
     url = __PREFIX + 'executions/' + id_exec
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.json()
 
@@ -248,21 +282,21 @@ def is_running(id_exec)->bool:
 # -----------------------------------------------------------------------------
 def get_exec_stderr(exec_id) -> str:
     url = __PREFIX + 'executions/' + exec_id + '/stderr'
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.text
 
 # -----------------------------------------------------------------------------
 def get_exec_stdout(exec_id) -> str:
     url = __PREFIX + 'executions/' + exec_id + '/stdout'
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.text
 
 # -----------------------------------------------------------------------------
 def get_exec_results(exec_id) -> str:
     url = __PREFIX + 'executions/' + exec_id + '/results'
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.json()
 
@@ -271,7 +305,7 @@ def kill_execution(exec_id, deleteFiles=False) -> bool:
     url = __PREFIX + 'executions/' + exec_id
     if deleteFiles:
         url += '?deleteFiles=true'
-    rq = requests.delete(url, headers=__headers, verify=__certif)
+    rq = __session.delete(url, headers=__headers, verify=__certif)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -283,14 +317,14 @@ def kill_execution(exec_id, deleteFiles=False) -> bool:
 # -----------------------------------------------------------------------------
 def list_pipeline()->list:
     url = __PREFIX + 'pipelines'
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.json()
 
 # -----------------------------------------------------------------------------
 def pipeline_def(pip_id)->dict:
     url = __PREFIX + 'pipelines/' + pip_id
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.json()
 
@@ -298,7 +332,7 @@ def pipeline_def(pip_id)->dict:
 # -----------------------------------------------------------------------------
 def platform_info()->dict:
     url = __PREFIX + 'platform'
-    rq = requests.get(url, headers=__headers, verify=__certif)
+    rq = __session.get(url, headers=__headers, verify=__certif)
     manage_errors(rq)
     return rq.json()
 
@@ -316,7 +350,7 @@ def get_apikey(username, password)->str:
             "username": username, 
             "password": password
            }
-    rq = requests.post(url, headers=headers, json=data_, verify=__certif)
+    rq = __session.post(url, headers=headers, json=data_, verify=__certif)
     manage_errors(rq)
     return rq.json()['httpHeaderValue']
 